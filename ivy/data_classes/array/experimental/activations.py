@@ -51,7 +51,7 @@ class _ArrayWithActivationsExperimental(abc.ABC):
         >>> print(z)
         ivy.array([ 1.38629448,  1.38629448, -1.38629436])
         """
-        return ivy.logit(self, eps=eps, complex_mode=complex_mode, out=out)
+        return ivy.logit(self._data, eps=eps, complex_mode=complex_mode, out=out)
 
     def thresholded_relu(
         self: ivy.Array,
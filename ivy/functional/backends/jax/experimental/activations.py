@@ -62,14 +62,14 @@ def logsigmoid(
 def selu(x: JaxArray, /, *, out: Optional[JaxArray] = None) -> JaxArray:
     ret = jax.nn.selu(x).astype(x.dtype)
     if ivy.exists(out):
-        return ivy.inplace_update(out, ret).astype(x.dtype)
+        return ivy.inplace_update(out, ret)
     return ret
 
 
 def silu(x: JaxArray, /, *, out: Optional[JaxArray] = None) -> JaxArray:
     ret = jax.nn.silu(x)
     if ivy.exists(out):
-        return ivy.inplace_update(out, ret).astype(x.dtype)
+        return ivy.inplace_update(out, ret.astype(x.dtype))
     return ret
 
 
@@ -78,7 +78,7 @@ def elu(
 ) -> JaxArray:
     ret = jax.nn.elu(x, alpha)
     if ivy.exists(out):
-        return ivy.inplace_update(out, ret).astype(x.dtype)
+        return ivy.inplace_update(out, ret.astype(x.dtype))
     return ret
 
 
@@ -102,14 +102,16 @@ def hardtanh(
     min_val: float = -1.0,
     out: Optional[JaxArray] = None,
 ) -> JaxArray:
-    ret = jnp.where(x > max_val, max_val, jnp.where(x < min_val, min_val, x))
+    ret = jnp.where(x > max_val, max_val, jnp.where(x < min_val, min_val, x)).astype(
+        x.dtype
+    )
     if ivy.exists(out):
-        return ivy.inplace_update(out, ret).astype(x.dtype)
-    return ivy.astype(ret, x.dtype)
+        return ivy.inplace_update(out, ret)
+    return ret
 
 
 def tanhshrink(x: JaxArray, /, *, out: Optional[JaxArray] = None) -> JaxArray:
     ret = jnp.subtract(x, jax.nn.tanh(x))
     if ivy.exists(out):
-        return ivy.inplace_update(out, ret).astype(x.dtype)
+        return ivy.inplace_update(out, ret.astype(x.dtype))
     return ret
@@ -9,6 +9,32 @@ from ivy.functional.backends.numpy.helpers import _scalar_output_to_0d_array
 from ivy.func_wrapper import with_unsupported_dtypes
 from . import backend_version
 
+# below this size, building the 256-entry table costs more than it saves
+_LOOKUP_8BIT_MIN_SIZE = 512
+
+
+def _lookup_8bit(fn, x, **kwargs):
+    # an 8-bit input takes at most 256 distinct values, so evaluate fn once per
+    # value and gather the results instead of computing it for every element
+    table = fn(np.arange(256, dtype=np.uint8).view(x.dtype), **kwargs)
+    return table[x.view(np.uint8)]
+
+
+def _silu_impl(x):
+    ret = np.asarray(np.exp(-x))
+    ret += 1
+    np.divide(x, ret, out=ret)
+    return ret
+
+
+def _elu_impl(x, alpha):
+    # branchless form: max(x, 0) + alpha * expm1(min(x, 0))
+    ret = np.expm1(np.minimum(x, 0))
+    if alpha != 1:
+        ret *= alpha
+    ret += np.maximum(x, 0)
+    return ret.astype(x.dtype, copy=False)
+
 
 def logit(
     x: np.ndarray,
@@ -20,10 +46,17 @@ def logit(
 ):
     x_dtype = x.dtype
     if eps is None:
-        x = np.where(np.logical_or(x > 1, x < 0), np.nan, x)
+        # for floating x outside [0, 1], x / (1 - x) is negative and log
+        # already yields nan; integer 1 - x can wrap around and complex log
+        # is finite, so those still need the explicit masking pass
+        if not np.issubdtype(x.dtype, np.floating):
+            x = np.where(np.logical_or(x > 1, x < 0), np.nan, x)
     else:
         x = np.clip(x, eps, 1 - eps)
-    ret = (np.log(x / (1 - x))).astype(x_dtype)
+    with np.errstate(invalid="ignore"):
+        ret = np.asarray(x / (1 - x))
+        np.log(ret, out=ret)
+    ret = ret.astype(x_dtype, copy=False)
     if np.isscalar(ret):
         return np.array(ret)
     return ret
@@ -37,6 +70,9 @@ def thresholded_relu(
     threshold: Union[int, float] = 0,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
+    if np.issubdtype(x.dtype, np.integer):
+        # integers have no inf/nan, so masking by multiplication is exact
+        return np.multiply(x, x > threshold, out=out, dtype=x.dtype)
     return np.where(x > threshold, x, 0).astype(x.dtype)
 
 
@@ -47,7 +83,9 @@ thresholded_relu.support_native_out = True
 def relu6(
     x: np.ndarray, /, *, complex_mode="jax", out: Optional[np.ndarray] = None
 ) -> np.ndarray:
-    return np.minimum(np.maximum(x, 0, dtype=x.dtype), 6, out=out, dtype=x.dtype)
+    # np.maximum returns a scalar for 0-d input, which cannot be used as out
+    ret = np.asarray(np.maximum(x, 0, out=out, dtype=x.dtype))
+    return np.minimum(ret, 6, out=ret, dtype=x.dtype)
 
 
 relu6.support_native_out = True
@@ -58,16 +96,25 @@ relu6.support_native_out = True
 def logsigmoid(
     input: np.ndarray, /, *, complex_mode="jax", out: Optional[np.ndarray] = None
 ) -> np.ndarray:
-    return -(np.log1p(np.exp(-(input))))
+    if np.iscomplexobj(input):
+        return -(np.log1p(np.exp(-(input))))
+    # stable form min(x, 0) - log1p(exp(-|x|)), exp never overflows
+    ret = np.asarray(np.exp(-np.abs(input)))
+    np.log1p(ret, out=ret)
+    return np.subtract(np.minimum(input, 0), ret, out=ret)
 
 
 @_scalar_output_to_0d_array
 def selu(x: np.ndarray, /, *, out: Optional[np.ndarray] = None) -> np.ndarray:
     alpha = 1.6732632423543772848170429916717
     scale = 1.0507009873554804934193349852946
-    ret = (scale * np.where(x > 0, x, alpha * np.expm1(x))).astype(x.dtype)
+    ret = np.expm1(np.minimum(x, 0))
+    ret *= alpha
+    ret += np.maximum(x, 0)
+    ret *= scale
+    ret = ret.astype(x.dtype, copy=False)
     if ivy.exists(out):
-        return ivy.inplace_update(out, ret).astype(x.dtype)
+        return ivy.inplace_update(out, ret)
     return ret
 
 
@@ -76,13 +123,15 @@ selu.support_native_out = True
 
 @_scalar_output_to_0d_array
 def silu(x: np.ndarray, /, *, out: Optional[np.ndarray] = None) -> np.ndarray:
-    ret = np.asarray(x * (1 / (1 + np.exp(-x))))
-    if ivy.exists(out):
-        return ivy.inplace_update(out, ret).astype(x.dtype)
-    if not ivy.is_array(x):
-        return ret
+    if x.dtype in (np.int8, np.uint8) and x.size >= _LOOKUP_8BIT_MIN_SIZE:
+        ret = _lookup_8bit(_silu_impl, x)
     else:
-        return np.asarray(x * (1 / (1 + np.exp(-x)))).astype(x.dtype)
+        ret = _silu_impl(x)
+    if ivy.is_array(x):
+        ret = ret.astype(x.dtype, copy=False)
+    if ivy.exists(out):
+        return ivy.inplace_update(out, ret)
+    return ret
 
 
 silu.support_native_out = True
@@ -92,10 +141,12 @@ silu.support_native_out = True
 def elu(
     x: np.ndarray, /, *, alpha: float = 1.0, out: Optional[np.ndarray] = None
 ) -> np.ndarray:
-    # exp = np.expm1(x)
-    ret = np.where(x > 0, x, np.multiply(alpha, np.expm1(x))).astype(x.dtype)
+    if x.dtype in (np.int8, np.uint8) and x.size >= _LOOKUP_8BIT_MIN_SIZE:
+        ret = _lookup_8bit(_elu_impl, x, alpha=alpha)
+    else:
+        ret = _elu_impl(x, alpha)
     if ivy.exists(out):
-        return ivy.inplace_update(out, ret).astype(x.dtype)
+        return ivy.inplace_update(out, ret)
     return ret
 
 
@@ -111,9 +162,14 @@ def celu(
     complex_mode="jax",
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    return (np.maximum(0, x) + alpha * np.expm1(np.minimum(0, x) / alpha)).astype(
-        x.dtype
-    )
+    if alpha == 1 and np.issubdtype(x.dtype, np.inexact):
+        # default alpha: the scaling passes are identities
+        ret = np.expm1(np.minimum(x, 0))
+    else:
+        ret = np.expm1(np.minimum(x, 0) / alpha)
+        ret *= alpha
+    ret += np.maximum(x, 0)
+    return ret.astype(x.dtype, copy=False)
 
 
 @with_unsupported_dtypes({"1.25.2 and below": ("float16", "bfloat16")}, backend_version)
@@ -126,10 +182,10 @@ def hardtanh(
     min_val: float = -1.0,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    ret = np.where(x > max_val, max_val, np.where(x < min_val, min_val, x))
+    ret = np.clip(x, min_val, max_val).astype(x.dtype, copy=False)
     if ivy.exists(out):
-        return ivy.inplace_update(out, ret).astype(x.dtype)
-    return ivy.astype(ret, x.dtype)
+        return ivy.inplace_update(out, ret)
+    return ret
 
 
 hardtanh.support_native_out = True
@@ -137,10 +193,12 @@ hardtanh.support_native_out = True
 
 @_scalar_output_to_0d_array
 def tanhshrink(x: np.ndarray, /, *, out: Optional[np.ndarray] = None) -> np.ndarray:
-    ret = np.subtract(x, np.tanh(x))
+    ret = np.asarray(np.tanh(x))
+    np.subtract(x, ret, out=ret)
+    ret = ret.astype(x.dtype, copy=False)
     if ivy.exists(out):
-        return ivy.inplace_update(out, ret).astype(x.dtype)
-    return ivy.astype(ret, x.dtype)
+        return ivy.inplace_update(out, ret)
+    return ret
 
 
 tanhshrink.support_native_out = True
@@ -55,8 +55,8 @@ def logsigmoid(
 def selu(x: Tensor, /, *, out: Optional[Tensor] = None) -> Tensor:
     ret = tf.nn.selu(x)
     if ivy.exists(out):
-        return ivy.inplace_update(out, ret).astype(x.dtype)
-    return ivy.astype(ret, x.dtype)
+        return ivy.inplace_update(out, ret)
+    return ret
 
 
 @with_unsupported_dtypes({"2.14.0 and below": ("complex",)}, backend_version)
@@ -68,8 +68,8 @@ def silu(
 ) -> Tensor:
     ret = tf.nn.silu(x)
     if ivy.exists(out):
-        return ivy.inplace_update(out, ret).astype(x.dtype)
-    return ivy.astype(ret, x.dtype)
+        return ivy.inplace_update(out, ret)
+    return ret
 
 
 @with_supported_dtypes({"2.14.0 and below": ("float",)}, backend_version)
@@ -77,8 +77,8 @@ def elu(x: Tensor, /, *, alpha: float = 1.0, out: Optional[Tensor] = None) -> Te
     alpha = tf.cast(alpha, x.dtype)
     ret = tf.cast(tf.where(x > 0, x, tf.multiply(alpha, tf.math.expm1(x))), x.dtype)
     if ivy.exists(out):
-        return ivy.inplace_update(out, ret).astype(x.dtype)
-    return ivy.astype(ret, x.dtype)
+        return ivy.inplace_update(out, ret)
+    return ret
 
 
 @with_supported_dtypes({"2.14.0 and below": ("float",)}, backend_version)
@@ -90,14 +90,17 @@ def hardtanh(
     min_val: float = -1.0,
     out: Optional[Tensor] = None,
 ) -> Tensor:
-    ret = tf.where(
-        tf.math.greater(x, max_val),
-        max_val,
-        tf.where(tf.math.less(x, min_val), min_val, x),
+    ret = tf.cast(
+        tf.where(
+            tf.math.greater(x, max_val),
+            max_val,
+            tf.where(tf.math.less(x, min_val), min_val, x),
+        ),
+        x.dtype,
     )
     if ivy.exists(out):
-        return ivy.inplace_update(out, ret).astype(x.dtype)
-    return ivy.astype(ret, x.dtype)
+        return ivy.inplace_update(out, ret)
+    return ret
 
 
 @with_supported_dtypes({"2.14.0 and below": ("float",)}, backend_version)
@@ -109,8 +112,8 @@ def tanhshrink(
 ) -> Tensor:
     ret = tf.math.subtract(x, tf.math.tanh(x))
     if ivy.exists(out):
-        return ivy.inplace_update(out, ret).astype(x.dtype)
-    return ivy.astype(ret, x.dtype)
+        return ivy.inplace_update(out, ret)
+    return ret
 
 
 @with_unsupported_dtypes({"2.14.0 and below": ("complex",)}, backend_version)
@@ -53,8 +53,8 @@ def logsigmoid(
 def selu(x: torch.Tensor, /, *, out: Optional[torch.Tensor] = None) -> torch.Tensor:
     ret = torch.nn.functional.selu(x)
     if ivy.exists(out):
-        return ivy.inplace_update(out, ret).astype(x.dtype)
-    return ivy.astype(ret, x.dtype)
+        return ivy.inplace_update(out, ret)
+    return ret
 
 
 @with_unsupported_dtypes({"2.0.1 and below": ("float16",)}, backend_version)
@@ -68,8 +68,8 @@ def elu(
 ) -> torch.Tensor:
     ret = torch.nn.functional.elu(x, alpha)
     if ivy.exists(out):
-        return ivy.inplace_update(out, ret).astype(x.dtype)
-    return ivy.astype(ret, x.dtype)
+        return ivy.inplace_update(out, ret)
+    return ret
 
 
 @with_unsupported_dtypes(
@@ -104,8 +104,8 @@ def hardtanh(
 ) -> torch.Tensor:
     ret = torch.nn.functional.hardtanh(x, max_val=max_val, min_val=min_val)
     if ivy.exists(out):
-        return ivy.inplace_update(out, ret).astype(x.dtype)
-    return ivy.astype(ret, x.dtype)
+        return ivy.inplace_update(out, ret)
+    return ret
 
 
 @with_unsupported_dtypes({"2.0.1 and below": ("float16",)}, backend_version)
@@ -114,5 +114,5 @@ def tanhshrink(
 ) -> torch.Tensor:
     ret = torch.nn.functional.tanhshrink(x)
     if ivy.exists(out):
-        return ivy.inplace_update(out, ret).astype(x.dtype)
-    return ivy.astype(ret, x.dtype)
+        return ivy.inplace_update(out, ret)
+    return ret
@@ -1,7 +1,11 @@
 # global
+import inspect
+import numpy as np
+import pytest
 from hypothesis import strategies as st
 
 # local
+import ivy
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_test
 
@@ -70,6 +74,39 @@ def test_elu(
     )
 
 
+# elu and silu on int8/uint8 inputs, via the numpy backend's lookup table
+@pytest.mark.parametrize("dtype", ["int8", "uint8"])
+@pytest.mark.parametrize("fn_name", ["elu", "silu"])
+def test_elu_silu_8bit_lookup(fn_name, dtype, backend_fw):
+    if backend_fw != "numpy":
+        pytest.skip()
+    from ivy.functional.backends.numpy.experimental import activations
+
+    kwargs = {"alpha": 0.5} if fn_name == "elu" else {}
+    impl = getattr(activations, f"_{fn_name}_impl")
+    size = 2 * activations._LOOKUP_8BIT_MIN_SIZE
+    x = np.resize(np.arange(256, dtype=np.uint8).view(dtype), size)
+    expected = impl(x, **kwargs).astype(dtype)
+    np.testing.assert_array_equal(
+        activations._lookup_8bit(impl, x, **kwargs).astype(dtype), expected
+    )
+
+    # setting the global backend rebinds the backend module's public names
+    ivy.set_backend(backend_fw)
+    try:
+        raw_fn = inspect.unwrap(getattr(activations, fn_name))
+        # above the threshold the lookup table is used, below it the direct path
+        for n in (size, activations._LOOKUP_8BIT_MIN_SIZE - 1):
+            raw_ret = raw_fn(x[:n], **kwargs)
+            assert isinstance(raw_ret, np.ndarray)
+            np.testing.assert_array_equal(raw_ret, expected[:n])
+            ret = getattr(ivy, fn_name)(ivy.array(x[:n]), **kwargs)
+            assert ret.dtype == dtype
+            np.testing.assert_array_equal(ret.to_numpy(), expected[:n])
+    finally:
+        ivy.previous_backend()
+
+
 # hardtanh
 @handle_test(
     fn_tree="functional.ivy.experimental.hardtanh",
@@ -154,6 +191,31 @@ def test_logsigmoid(*, dtype_and_x, test_flags, backend_fw, fn_name, on_device):
     )
 
 
+# logsigmoid for large negative inputs, where exp(-x) overflows
+@handle_test(
+    fn_tree="functional.ivy.experimental.logsigmoid",
+    dtype_and_x=helpers.dtype_and_values(
+        available_dtypes=helpers.get_dtypes("float"),
+        min_value=-1000,
+        max_value=-20,
+    ),
+    test_with_out=st.just(False),
+)
+def test_logsigmoid_large_negative(
+    *, dtype_and_x, test_flags, backend_fw, fn_name, on_device
+):
+    input_dtype, x = dtype_and_x
+    test_flags.num_positional_args = len(x)
+    helpers.test_function(
+        input_dtypes=input_dtype,
+        test_flags=test_flags,
+        backend_to_test=backend_fw,
+        fn_name=fn_name,
+        on_device=on_device,
+        input=x[0],
+    )
+
+
 # prelu
 @handle_test(
     fn_tree="prelu",